@@ -6,9 +6,14 @@ This build adds:
 • Prints the first 5 chars of the token safely for verification.
 • If missing, idles instead of crashing so Railway stops looping.
 """
-import os
-import asyncio
+import functools
 import logging
+import os
+import signal
+import threading
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
+
 import discord
 from discord import app_commands
 
@@ -19,9 +24,23 @@ logging.basicConfig(
 )
 log = logging.getLogger("riftlands.debug")
 
-TOKEN = os.getenv("DISCORD_TOKEN")
-GUILD_ID_ENV = os.getenv("RIFTLANDS_GUILD_ID")
-GUILD_ID = int(GUILD_ID_ENV) if GUILD_ID_ENV and GUILD_ID_ENV.isdigit() else None
+# ------------- Config (single os.environ snapshot) -------------
+@dataclass(frozen=True)
+class Config:
+    token: str = field(repr=False)  # never print the full secret
+    guild_id: Optional[int]
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] = os.environ) -> "Config":
+        guild_id_env = env.get("RIFTLANDS_GUILD_ID", "")
+        return cls(
+            token=env.get("DISCORD_TOKEN", ""),
+            guild_id=int(guild_id_env) if guild_id_env.isdigit() else None,
+        )
+
+CONFIG = Config.from_env()
+TOKEN = CONFIG.token
+GUILD_ID = CONFIG.guild_id
 
 # Debug logging for environment vars
 if TOKEN:
@@ -29,20 +48,30 @@ if TOKEN:
 else:
     log.error("❌ DISCORD_TOKEN is missing! Bot will idle instead of crashing.")
     log.error("Please add DISCORD_TOKEN in Railway → Variables.")
-    # Idle forever so Railway doesn't restart-loop
-    asyncio.get_event_loop().run_until_complete(asyncio.sleep(3600))
+    # Idle forever so Railway doesn't restart-loop; blocks without waking
+    # until the process receives a signal (e.g. SIGTERM on redeploy).
+    if hasattr(signal, "pause"):
+        signal.pause()
+    else:
+        threading.Event().wait()
     raise SystemExit
 
+# Only slash commands are handled; skip gateway streams nothing listens to.
 intents = discord.Intents.default()
-intents.message_content = True
-client = discord.Client(intents=intents)
+intents.messages = False
+intents.reactions = False
+intents.typing = False
+client = discord.Client(intents=intents, allowed_mentions=discord.AllowedMentions.none())
 tree = app_commands.CommandTree(client)
 
 # ------------- Slash Command: /ping -------------
+@functools.lru_cache(maxsize=128)
+def _pong(latency_ms: int) -> str:
+    return f"Pong! 🏓 ({latency_ms}ms)"
+
 @tree.command(name="ping", description="Check bot health and latency.")
 async def ping(interaction: discord.Interaction):
-    latency_ms = round(client.latency * 1000)
-    await interaction.response.send_message(f"Pong! 🏓 ({latency_ms}ms)", ephemeral=True)
+    await interaction.response.send_message(_pong(round(client.latency * 1000)), ephemeral=True)
 
 # ------------- Startup -------------
 @client.event